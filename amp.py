@@ -2,10 +2,10 @@
 MFLI Live Monitor (Minimal) — FIXED v7
 
 Fixes included:
-- Uses getSample() method which is the correct way to read demod samples
-- Works with older zhinst-toolkit and LabOne versions
+- Streams demod 0 X/Y through a LabOne DataAcquisitionModule
 - Handles "device already in use" more gracefully
-- Properly disconnects on Stop/Close
+- Stop keeps the device and its subscription warm; they are released on device change or Close
+- Reads samples on a worker QThread so the GUI never blocks on the data server
 
 Install:
   pip install zhinst-toolkit PyQt5
@@ -14,33 +14,305 @@ Run:
   python amp_fixed_v7.py
 """
 
+import math
+import re
 import sys
-from typing import Optional
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-from PyQt5.QtCore import QTimer, Qt
+import numpy as np
+from PyQt5.QtCore import (
+    QLocale, QMetaObject, QMutex, QObject, QThread, QTimer, Qt, pyqtSignal, pyqtSlot
+)
+from PyQt5.QtGui import QDoubleValidator
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QComboBox, QLineEdit, QFormLayout, QGroupBox, QMessageBox
 )
 
-from zhinst.toolkit import Session
+from devices import close_all_sessions, close_session, get_session, list_visible
+
+if TYPE_CHECKING:
+    from zhinst.toolkit import Session
+
+EMPTY_READOUT = "X: —\nY: —\nAmplitude (R): —\nPhase (phi): —"
+_format_readout = "X: {:+.6e}\nY: {:+.6e}\nAmplitude (R): {:.6e}\nPhase (phi): {:+.3f} rad".format
+_IN_USE_RE = re.compile(r"in use|already connected|32789|different server", re.IGNORECASE)
 
 
 def looks_like_in_use_error(msg: str) -> bool:
-    m = (msg or "").lower()
-    return ("in use" in m) or ("already connected" in m) or ("32789" in m) or ("different server" in m)
+    return bool(_IN_USE_RE.search(msg or ""))
+
+
+MIN_POLL_S = 0.05
+MAX_POLL_S = 0.5
+STALL_S = 2.0
+
+
+def poll_duration_for(rate: float) -> float:
+    """Poll window (s) that collects ~20 samples per chunk, clamped to 50-500 ms."""
+    if rate <= 0:
+        return MAX_POLL_S
+    return max(MIN_POLL_S, min(MAX_POLL_S, 20.0 / rate))
+
+
+def stall_timeout_for(burst_size: int, rate: float) -> float:
+    """Seconds without samples before the stream counts as stalled: 3 bursts, at least 2 s."""
+    if rate <= 0:
+        return STALL_S
+    return max(STALL_S, 3.0 * burst_size / rate)
+
+
+class DaqModuleStrategy:
+    """
+    Stream X/Y through a LabOne DataAcquisitionModule. The module collects
+    bursts in its own thread; read() only hands over what arrived since the
+    previous call and never waits on the data server.
+    """
+
+    def __init__(self, daq, device_id: str, sample_path: str, rate: float, duration: float):
+        self._device_id = device_id
+        self._cols = max(1, int(np.ceil(rate * duration)))
+        # Samples only arrive in whole bursts of this many
+        self.burst_size = self._cols
+        # Dispatch table built once: module read() path (lower case) -> output column.
+        # More signals only need an entry here, the read loop stays unchanged.
+        self._columns = {f"{sample_path}.{col}".lower(): col for col in ("x", "y")}
+        self._daq = daq
+        self._module = None
+
+    def start(self):
+        if self._module is None:
+            self._module = self._daq.dataAcquisitionModule()
+        self._module.set("dataAcquisitionModule/device", self._device_id)
+        self._module.set("dataAcquisitionModule/type", 0)        # continuous
+        # Exact grid: no interpolation; the burst duration follows from grid/cols
+        # and the demod rate (dataAcquisitionModule/duration is read-only here)
+        self._module.set("dataAcquisitionModule/grid/mode", 4)
+        self._module.set("dataAcquisitionModule/endless", 1)
+        self._module.set("dataAcquisitionModule/grid/cols", self._cols)
+        for path in self._columns:
+            self._module.subscribe(path)
+        self._module.execute()
+
+    def pause(self):
+        # Stops acquiring but keeps the subscription, so resume() skips the setup
+        self._module.finish()
+
+    def resume(self):
+        # Drop whatever was read out before finish(); it is stale by now
+        self._module.read(True)
+        self._module.execute()
+
+    def poll(self, duration: float):
+        QThread.msleep(int(duration * 1000))
+        out = {}
+        for path, bursts in self._module.read(True).items():
+            col = self._columns.get(path)
+            if col is not None and bursts:
+                # More than one burst may be returned if we read slower than the burst
+                # duration; they are left as views so the caller can join them in place
+                out[col] = [burst['value'].ravel() for burst in bursts]
+        if len(out) < len(self._columns):
+            return None
+        # Callers get aligned, non-empty columns or nothing
+        sizes = {sum(burst.size for burst in bursts) for bursts in out.values()}
+        if len(sizes) != 1 or 0 in sizes:
+            return None
+        return out
+
+    def stop(self):
+        if self._module is None:
+            return
+        self._module.finish()
+        self._module.unsubscribe("*")
+
+    def close(self):
+        # clear() ends the module's own threads; without it every device or
+        # rate change would leave one behind
+        if self._module is None:
+            return
+        try:
+            self.stop()
+        finally:
+            self._module.clear()
+            self._module = None
+
+
+class PollWorker(QObject):
+    """
+    Streams demod 0 samples in a background QThread and hands them to the GUI
+    through queued signals, so a slow data server never freezes the window.
+    How samples are fetched is up to the strategy passed in by start_live.
+    """
+    finished = pyqtSignal()
+    ready = pyqtSignal()
+    failed = pyqtSignal(str)
+    sample = pyqtSignal(float, str)  # t, formatted X/Y/R/phi readout
+    error = pyqtSignal(str)
+
+    def __init__(self, strategy, configure=None, rate: float = 200.0, poll_duration: float = 0.1,
+                 subscribed: bool = False):
+        super().__init__()
+        # One-shot device setup, run on this thread so Start Live returns immediately
+        self._configure = configure
+        self.poll_duration = poll_duration
+        self._running = True
+        # Set by the GUI while the window is hidden; the worker then pauses the
+        # strategy itself so no ziDAQServer call is made from two threads
+        self._paused = False
+        self._subscribed = subscribed  # kept alive across Stop/Start by the GUI
+        self._acquiring = False
+        self._strategy = strategy
+        # Moving average of samples per chunk; the poll window is retuned from it
+        self._ema_count = float(strategy.burst_size)
+        self._ticks = 0
+
+        # Reused for every chunk: the bursts are joined straight into them, so
+        # steady-state polling allocates no new sample arrays
+        self._alloc_buffers(int(rate * poll_duration * 4))
+
+    def _alloc_buffers(self, n: int):
+        n = max(n, 64)
+        self._xbuf = np.empty(n, dtype=np.float64)
+        self._ybuf = np.empty(n, dtype=np.float64)
+        self._rbuf = np.empty(n, dtype=np.float64)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            if self._configure is not None:
+                self._configure()
+            if self._subscribed:
+                self._strategy.resume()
+            else:
+                self._strategy.start()
+        except Exception as e:
+            self.failed.emit(str(e))
+            self.finished.emit()
+            return
+        self._subscribed = True
+        self._acquiring = True
+        self.ready.emit()
+
+        while self._running:
+            if self._paused == self._acquiring:
+                self._set_acquiring(not self._paused)
+            if self._paused:
+                QThread.msleep(100)
+                continue
+            self.poll_and_update()
+
+        # Stop acquiring on Stop, so no backlog piles up until the next Start
+        if self._acquiring:
+            self._set_acquiring(False)
+        self.finished.emit()
+
+    def _set_acquiring(self, on: bool):
+        try:
+            if on:
+                self._strategy.resume()
+            else:
+                self._strategy.pause()
+        except Exception as e:
+            self.error.emit(f"Acquisition change failed: {e}")
+        self._acquiring = on
+
+    def _adapt_poll_duration(self, n: int):
+        # Aim for about one burst per chunk: halve the window when chunks hold
+        # several bursts, double it when most reads come back empty. The band is
+        # wider than a factor of 2, so one step can't push it across the other
+        # threshold; only every 10th chunk so the window doesn't oscillate
+        self._ema_count = 0.9 * self._ema_count + 0.1 * n
+        self._ticks += 1
+        if self._ticks % 10:
+            return
+        burst = self._strategy.burst_size
+        if self._ema_count > 2.5 * burst:
+            self.poll_duration = max(MIN_POLL_S, self.poll_duration / 2)
+        elif self._ema_count < 0.5 * burst:
+            self.poll_duration = min(MAX_POLL_S, self.poll_duration * 2)
+
+    def poll_and_update(self):
+        try:
+            # The strategy returns None or 'x'/'y' burst lists of the same non-zero length
+            sample = self._strategy.poll(self.poll_duration)
+            if sample is None:
+                self._adapt_poll_duration(0)
+                return
+
+            # Use the whole polled chunk instead of only its newest entry:
+            # X, Y and R are averaged over the chunk, phase is the newest value
+            n = sum(burst.size for burst in sample['x'])
+            self._adapt_poll_duration(n)
+            if n > self._xbuf.size:
+                self._alloc_buffers(2 * n)
+            xs = self._xbuf[:n]
+            ys = self._ybuf[:n]
+            rs = self._rbuf[:n]
+            np.concatenate(sample['x'], out=xs)
+            np.concatenate(sample['y'], out=ys)
+            np.hypot(xs, ys, out=rs)
+            # Plain np.float64 scalars; _format_readout turns them into the signal's text
+            x = xs.mean()
+            y = ys.mean()
+            r = rs.mean()
+            phi = math.atan2(ys[-1], xs[-1])
+
+        except Exception as e:
+            self.error.emit(f"Read error: {e}")
+            QThread.msleep(200)  # don't spin on a persistent error
+            return
+
+        # Format here so the GUI thread only has to call setText
+        self.sample.emit(time.monotonic(), _format_readout(x, y, r, phi))
 
 
 class MFLILiveGUI(QWidget):
+    # Slots for our own attributes (QWidget still provides a __dict__ for Qt's)
+    __slots__ = (
+        # state
+        "session", "_endpoint", "device_id", "streaming", "poll_thread", "worker",
+        "_strategy", "_strategy_subscribed", "_live_key", "_sample_path",
+        "_applied_settings", "_freq", "_tc", "_rate",
+        "_last_sample_t", "_stall_s", "_in_stream_error", "_last_txt",
+        "_pending_mutex", "_pending_sample", "_flush_queued",
+        # widgets
+        "host_edit", "port_edit", "connect_btn", "refresh_btn", "device_combo",
+        "freq_edit", "tc_edit", "rate_edit", "_setting_edits",
+        "start_btn", "stop_btn", "status_lbl", "readout_lbl", "timer",
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("MFLI Live Monitor (Minimal) - Fixed v7")
         self.setMinimumWidth(560)
 
         # --- State ---
-        self.session: Optional[Session] = None
+        self.session: Optional["Session"] = None
+        self._endpoint: Optional[Tuple[str, int]] = None
         self.device_id: Optional[str] = None
+        self._strategy = None
+        self._strategy_subscribed: bool = False
+        self._live_key = None
+        self._sample_path: Optional[str] = None
         self.streaming: bool = False
+        self._applied_settings: Dict[str, Dict[str, float]] = {}
+        self._freq: float = 1000.0
+        self._tc: float = 0.01
+        self._rate: float = 200.0
+        self.poll_thread: Optional[QThread] = None
+        self.worker: Optional[PollWorker] = None
+        self._last_sample_t: float = 0.0
+        self._stall_s: float = STALL_S
+        self._in_stream_error: bool = False
+        # Depth-1 mailbox between the worker and the GUI: only the newest sample
+        # is kept and at most one flush is queued, so a slow repaint drops
+        # intermediate samples instead of building up a backlog of events
+        self._pending_mutex = QMutex()
+        self._pending_sample = None
+        self._flush_queued = False
 
         # --- UI widgets ---
         self.host_edit = QLineEdit("192.168.60.166")  # set to your lab server by default
@@ -54,25 +326,46 @@ class MFLILiveGUI(QWidget):
         self.tc_edit = QLineEdit("0.01")     # s
         self.rate_edit = QLineEdit("200")    # Sa/s
 
+        # Validate at input time and keep the parsed values, so Start never re-parses.
+        # The C locale with group separators rejected only accepts plain numbers
+        # like "1000" or "1e-3", never "1,000"
+        number_locale = QLocale.c()
+        number_locale.setNumberOptions(QLocale.RejectGroupSeparator)
+        self._setting_edits = (
+            (self.freq_edit, "_freq"),
+            (self.tc_edit, "_tc"),
+            (self.rate_edit, "_rate"),
+        )
+        for (edit, attr), (top, decimals) in zip(self._setting_edits, ((1e9, 6), (1e6, 9), (1e9, 3))):
+            validator = QDoubleValidator(0.0, top, decimals, edit)
+            validator.setLocale(number_locale)
+            edit.setValidator(validator)
+            edit.editingFinished.connect(
+                lambda edit=edit, attr=attr: self._store_setting(edit, attr)
+            )
+
         self.start_btn = QPushButton("Start Live")
         self.stop_btn = QPushButton("Stop")
         self.stop_btn.setEnabled(False)
 
         self.status_lbl = QLabel("Status: Disconnected")
         self.status_lbl.setWordWrap(True)
-
-        self.x_lbl = QLabel("X: —")
-        self.y_lbl = QLabel("Y: —")
-        self.r_lbl = QLabel("Amplitude (R): —")
-        self.phi_lbl = QLabel("Phase (phi): —")
-        for lab in (self.x_lbl, self.y_lbl, self.r_lbl, self.phi_lbl):
-            lab.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            lab.setStyleSheet("font-size: 16px;")
-
-        # Poll timer
+        self.status_lbl.setTextFormat(Qt.PlainText)
+
+        # One multi-line label: a single setText (and repaint) per sample instead of four
+        self.readout_lbl = QLabel(EMPTY_READOUT)
+        self.readout_lbl.setTextFormat(Qt.PlainText)
+        self.readout_lbl.setTextInteractionFlags(Qt.NoTextInteraction)
+        self.readout_lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        # Fixed-width digits keep the label size stable, so new values never trigger a relayout
+        self.readout_lbl.setStyleSheet("font-size: 16px; font-family: monospace;")
+        self._last_txt = EMPTY_READOUT
+
+        # Watchdog timer: acquisition runs in PollWorker, this only flags a stalled stream.
+        # Created once here and only ever started/stopped, never recreated.
         self.timer = QTimer(self)
-        self.timer.setInterval(200)  # ms UI refresh (not the instrument demod rate)
-        self.timer.timeout.connect(self.poll_and_update)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.check_stream)
 
         self._build_layout()
         self._wire_events()
@@ -111,10 +404,7 @@ class MFLILiveGUI(QWidget):
         live_box = QGroupBox("Live Output (Demod 0 Sample)")
         live_layout = QVBoxLayout()
         live_layout.addWidget(self.status_lbl)
-        live_layout.addWidget(self.x_lbl)
-        live_layout.addWidget(self.y_lbl)
-        live_layout.addWidget(self.r_lbl)
-        live_layout.addWidget(self.phi_lbl)
+        live_layout.addWidget(self.readout_lbl)
         live_box.setLayout(live_layout)
         root.addWidget(live_box)
 
@@ -129,6 +419,23 @@ class MFLILiveGUI(QWidget):
     def set_status(self, msg: str):
         self.status_lbl.setText(f"Status: {msg}")
 
+    @pyqtSlot(str)
+    def stream_error(self, msg: str):
+        """
+        Error while streaming. Never a QMessageBox here: its nested event loop
+        would stall the stream. Dialogs are only for user-initiated actions.
+        """
+        if not self.streaming:
+            return  # queued before stop_live joined the worker
+        self.set_status(msg)
+        if not self._in_stream_error:
+            self._in_stream_error = True
+            self.status_lbl.setStyleSheet("color: red;")
+
+    def _clear_stream_error(self):
+        self._in_stream_error = False
+        self.status_lbl.setStyleSheet("")
+
     def show_error(self, title: str, msg: str):
         QMessageBox.critical(self, title, msg)
 
@@ -144,10 +451,23 @@ class MFLILiveGUI(QWidget):
             self.show_error("Bad Port", "Port must be an integer (e.g., 8004).")
             return
 
+        # The kept-alive subscription belongs to the previous session
+        if self.streaming:
+            self.stop_live()
+        self.release_device()
+
+        # Switching endpoints: let go of the previous data server connection
+        if self._endpoint is not None and self._endpoint != (host, port):
+            self._drop_session()
+
         try:
-            self.session = Session(host, port)
+            self.session = get_session(host, port)
+            self._endpoint = (host, port)
+            self._applied_settings.clear()  # don't trust writes made through another connection
         except Exception as e:
+            close_session(host, port)
             self.session = None
+            self._endpoint = None
             self.set_status("Disconnected")
             self.show_error("Connection Failed", f"Could not connect to LabOne Data Server at {host}:{port}\n\n{e}")
             return
@@ -161,22 +481,55 @@ class MFLILiveGUI(QWidget):
             return
 
         try:
-            devs = self.session.devices.visible()
+            devs = list_visible(self.session)
         except Exception as e:
+            # Most likely the data server went away (e.g. LabOne was restarted); drop
+            # the cached Session so the next Connect builds a fresh one
+            self.release_device()
+            self._drop_session()
+            self.set_status("Disconnected")
             self.show_error("Device Query Failed", f"Could not query visible devices.\n\n{e}")
             return
 
-        self.device_combo.clear()
+        # Only add/remove what changed; a stable device list leaves the combo untouched
+        wanted = list(devs) if devs else ["(none found)"]
+        current = [self.device_combo.itemText(i) for i in range(self.device_combo.count())]
+        if current != wanted:
+            self.device_combo.blockSignals(True)
+            try:
+                for d in set(current) - set(wanted):
+                    self.device_combo.removeItem(self.device_combo.findText(d))
+                for d in wanted:
+                    if d not in current:
+                        self.device_combo.addItem(d)
+            finally:
+                self.device_combo.blockSignals(False)
+
         if not devs:
-            self.device_combo.addItem("(none found)")
             self.set_status("Connected, but no devices visible.")
             return
 
-        for d in devs:
-            self.device_combo.addItem(d)
-
         self.set_status(f"Connected. Found {len(devs)} device(s). Select one, then Start Live.")
 
+    def _drop_session(self):
+        if self._endpoint is not None:
+            close_session(*self._endpoint)
+        self.session = None
+        self._endpoint = None
+
+    def _store_setting(self, edit: QLineEdit, attr: str):
+        # Parse with the validator's own locale; an exception escaping a Qt slot
+        # would abort the process, so unparsable text just keeps the old value
+        value, ok = edit.validator().locale().toDouble(edit.text())
+        if ok:
+            setattr(self, attr, value)
+
+    def _sync_setting_edits(self):
+        # Half-typed input (e.g. "1e-") never reached the cache; show what will be applied
+        for edit, attr in self._setting_edits:
+            if not edit.hasAcceptableInput():
+                edit.setText(repr(getattr(self, attr)))  # round-trips exactly, unlike :g
+
     def apply_minimal_settings(self, device_id: str):
         """
         Minimal config. This assumes you're using demod 0 and osc 0.
@@ -184,33 +537,30 @@ class MFLILiveGUI(QWidget):
         """
         dev = self.session.devices[device_id]
 
-        # Enable input and demod
-        dev.sigins[0].on(1)
-        dev.demods[0].enable(1)
-
-        # Parse settings with fallbacks
-        try:
-            freq = float(self.freq_edit.text().strip())
-        except ValueError:
-            freq = 1000.0
-
-        try:
-            tc = float(self.tc_edit.text().strip())
-        except ValueError:
-            tc = 0.01
-
-        try:
-            rate = float(self.rate_edit.text().strip())
-        except ValueError:
-            rate = 200.0
-
-        # Apply settings
-        dev.oscs[0].freq(freq)
-        dev.demods[0].timeconstant(tc)
-        dev.demods[0].order(4)   # fixed for simplicity
-        dev.demods[0].rate(rate)
-
-        # Optional autorange (ignore if your version doesn't support it)
+        # Enable input and demod, then apply settings (already validated and
+        # parsed as the user typed them)
+        wanted = (
+            ("sigins/0/on", dev.sigins[0].on, 1),
+            ("demods/0/enable", dev.demods[0].enable, 1),
+            ("oscs/0/freq", dev.oscs[0].freq, self._freq),
+            ("demods/0/timeconstant", dev.demods[0].timeconstant, self._tc),
+            ("demods/0/order", dev.demods[0].order, 4),   # fixed for simplicity
+            ("demods/0/rate", dev.demods[0].rate, self._rate),
+        )
+
+        # Skip values this GUI already wrote to this device; a Stop/Start cycle
+        # with unchanged settings then costs no writes at all
+        applied = self._applied_settings.setdefault(device_id, {})
+        updates = [(key, node, value) for key, node, value in wanted if applied.get(key) != value]
+        if updates:
+            # Ship all writes to the data server in one transaction instead of one round-trip each
+            with self.session.set_transaction():
+                for _, node, value in updates:
+                    node(value)
+            applied.update((key, value) for key, _, value in updates)
+
+        # Optional autorange (ignore if your version doesn't support it); kept out of
+        # the transaction so an unsupported node can't fail the whole batch
         try:
             dev.sigins[0].autorange(1)
         except Exception:
@@ -230,149 +580,201 @@ class MFLILiveGUI(QWidget):
         if self.streaming:
             self.stop_live()
 
-        self.device_id = device_id
+        self._sync_setting_edits()
 
-        # Try connecting device (some setups require it; if already in use, we may still be able to read)
-        try:
-            self.session.connect_device(device_id)
-        except Exception as e:
-            msg = str(e)
-            if looks_like_in_use_error(msg):
-                # We'll still try to read; if that fails we'll show the real error.
-                pass
-            else:
-                self.show_error("Start Failed", f"Could not connect device {device_id}.\n\n{e}")
-                self.device_id = None
-                return
+        # Stop keeps the device connected and the module subscribed; Start on the
+        # same device and rate then reuses both instead of reconnecting
+        reuse = self._strategy is not None and self._live_key == (device_id, self._rate)
+        if not reuse:
+            self.release_device()
 
-        try:
-            self.apply_minimal_settings(device_id)
+        self.device_id = device_id
 
-        except Exception as e:
-            self.show_error(
-                "Start Failed",
-                "Could not configure device.\n\n"
-                f"Device: {device_id}\n\n{e}\n\n"
-                "If you see 'in use', close LabOne UI and other python scripts, or restart the LabOne Data Server."
+        if not reuse:
+            # Try connecting device (some setups require it; if already in use, we may still be able to read)
+            try:
+                self.session.connect_device(device_id)
+            except Exception as e:
+                msg = str(e)
+                if looks_like_in_use_error(msg):
+                    # We'll still try to read; if that fails we'll show the real error.
+                    pass
+                else:
+                    self.show_error("Start Failed", f"Could not connect device {device_id}.\n\n{e}")
+                    self.device_id = None
+                    return
+
+            # Device configuration and subscribe happen on the worker thread
+            self._sample_path = f"/{device_id}/demods/0/sample"
+            self._strategy = DaqModuleStrategy(
+                self.session.daq_server, device_id, self._sample_path, self._rate, poll_duration_for(self._rate)
             )
-            self.device_id = None
-            return
+            self._live_key = (device_id, self._rate)
+            self._strategy_subscribed = False
 
+        # Slow demod rates deliver bursts further apart than the default 2 s
+        self._stall_s = stall_timeout_for(self._strategy.burst_size, self._rate)
         self.streaming = True
-        self.timer.start()
+        self.poll_thread = QThread()
+        self.worker = PollWorker(
+            self._strategy,
+            configure=partial(self.apply_minimal_settings, device_id),
+            rate=self._rate,
+            poll_duration=poll_duration_for(self._rate),
+            subscribed=self._strategy_subscribed,
+        )
+        self.worker.moveToThread(self.poll_thread)
+        self.poll_thread.started.connect(self.worker.run)
+        self.worker.finished.connect(self.poll_thread.quit)
+        self.worker.ready.connect(self._on_ready, Qt.QueuedConnection)
+        self.worker.failed.connect(self._on_start_failed, Qt.QueuedConnection)
+        self.worker.sample.connect(self._stash_sample, Qt.DirectConnection)
+        self.worker.error.connect(self.stream_error, Qt.QueuedConnection)
+        self.poll_thread.start()
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
-        self.set_status(f"Reading from {device_id}/demods/0/sample")
+        # The worker owns ziDAQServer while streaming; a device query from this
+        # thread would use the same connection concurrently
+        self.refresh_btn.setEnabled(False)
+        self.set_status(f"Configuring {device_id}...")
+
+    @pyqtSlot()
+    def _on_ready(self):
+        if not self.streaming:
+            return  # stopped while the worker was still configuring
+        self._last_sample_t = time.monotonic()
+        self.timer.start()
+        self.set_status(f"Reading from {self._sample_path}")
+
+    @pyqtSlot(str)
+    def _on_start_failed(self, msg: str):
+        if not self.streaming:
+            return
+        device_id = self.device_id
+        self.stop_live()
+        self.release_device()
+        self.show_error(
+            "Start Failed",
+            "Could not configure device.\n\n"
+            f"Device: {device_id}\n\n{msg}\n\n"
+            "If you see 'in use', close LabOne UI and other python scripts, or restart the LabOne Data Server."
+        )
 
     def stop_live(self):
-        # Stop timer first
+        # Stop watchdog and worker thread first, then clear state
         self.timer.stop()
-
-        # Try to disconnect device to release "in use" lock (best effort)
-        if self.session and self.device_id:
-            try:
-                self.session.disconnect_device(self.device_id)
-            except Exception:
-                # Some toolkit versions may not provide this; ignoring is OK.
-                pass
-
         self.streaming = False
+        if self.worker is not None:
+            self.worker._running = False
+        if self.poll_thread is not None:
+            self.poll_thread.quit()
+            self.poll_thread.wait()
+        if self.worker is not None:
+            # The worker has already finish()ed the module; device and subscription stay
+            self._strategy_subscribed = self.worker._subscribed
+        self.worker = None
+        self.poll_thread = None
+
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
+        self.refresh_btn.setEnabled(True)
+        self._clear_stream_error()
         self.set_status("Connected (stream stopped)")
 
         # Clear labels (optional)
-        self.x_lbl.setText("X: —")
-        self.y_lbl.setText("Y: —")
-        self.r_lbl.setText("Amplitude (R): —")
-        self.phi_lbl.setText("Phase (phi): —")
+        self.readout_lbl.setText(EMPTY_READOUT)
+        self._last_txt = EMPTY_READOUT
 
-    def poll_and_update(self):
-        if not (self.session and self.device_id):
-            return
+    def release_device(self):
+        """Drop the kept-alive subscription and device connection (device change or Close)."""
+        if self._strategy is not None:
+            try:
+                self._strategy.close()
+            except Exception:
+                pass
+            self._strategy = None
+        self._strategy_subscribed = False
+        self._live_key = None
 
-        try:
-            # Use getSample() - the proper method for reading demod samples in older versions
-            # This returns a dict with the sample data
-            sample_path = f"/{self.device_id}/demods/0/sample"
-            
-            # Try getSample() method
+        # Try to disconnect device to release "in use" lock (best effort)
+        if self.session and self.device_id:
             try:
-                sample = self.session.daq_server.getSample(sample_path)
-            except AttributeError:
-                # If getSample doesn't exist, try getAsEvent
-                try:
-                    sample = self.session.daq_server.getAsEvent(sample_path)
-                except AttributeError:
-                    # Last resort: try reading the actual sample node as a complete structure
-                    result = self.session.daq_server.get(sample_path)
-                    if result and sample_path in result:
-                        sample = result[sample_path]
-                    else:
-                        self.set_status("Could not read sample - unsupported API version")
-                        return
-            
-            # Extract x, y, r, theta from the sample
-            # The sample structure varies by version, so try multiple approaches
-            x = 0.0
-            y = 0.0
-            r = 0.0
-            phi = 0.0
-            
-            def safe_extract(value):
-                """Safely extract a float from various formats"""
-                if isinstance(value, (list, tuple)) and len(value) > 0:
-                    return float(value[0])
-                return float(value)
-            
-            if isinstance(sample, dict):
-                # Try direct keys first
-                if 'x' in sample:
-                    x = safe_extract(sample['x'])
-                if 'y' in sample:
-                    y = safe_extract(sample['y'])
-                if 'r' in sample:
-                    r = safe_extract(sample['r'])
-                if 'theta' in sample:
-                    phi = safe_extract(sample['theta'])
-                elif 'phi' in sample:
-                    phi = safe_extract(sample['phi'])
-                
-                # If direct keys didn't work, try 'value' wrapper
-                if 'value' in sample:
-                    val = sample['value']
-                    if isinstance(val, dict):
-                        if 'x' in val:
-                            x = safe_extract(val['x'])
-                        if 'y' in val:
-                            y = safe_extract(val['y'])
-                        if 'r' in val:
-                            r = safe_extract(val['r'])
-                        if 'theta' in val:
-                            phi = safe_extract(val['theta'])
-                        elif 'phi' in val:
-                            phi = safe_extract(val['phi'])
-            
-            # If we got X and Y but not R and phi, calculate them
-            import math
-            if (x != 0.0 or y != 0.0) and r == 0.0:
-                r = math.sqrt(x*x + y*y)
-                phi = math.atan2(y, x)
+                self.session.disconnect_device(self.device_id)
+            except Exception:
+                # Some toolkit versions may not provide this; ignoring is OK.
+                pass
+            # Other clients may change the device once it is released; write
+            # every setting again on the next Start
+            self._applied_settings.pop(self.device_id, None)
+        self.device_id = None
+
+    def _stash_sample(self, t: float, txt: str):
+        # Runs on the worker thread
+        self._pending_mutex.lock()
+        try:
+            self._pending_sample = (t, txt)
+            if self._flush_queued:
+                return
+            self._flush_queued = True
+        finally:
+            self._pending_mutex.unlock()
+        QMetaObject.invokeMethod(self, "_flush_pending", Qt.QueuedConnection)
 
-        except Exception as e:
-            self.set_status(f"Read error: {e}")
-            return
+    @pyqtSlot()
+    def _flush_pending(self):
+        self._pending_mutex.lock()
+        try:
+            sample = self._pending_sample
+            self._pending_sample = None
+            self._flush_queued = False
+        finally:
+            self._pending_mutex.unlock()
+        if sample is not None:
+            self._on_sample(*sample)
+
+    def _on_sample(self, t: float, txt: str):
+        if not self.streaming:
+            return  # queued before stop_live joined the worker
+        self._last_sample_t = t
+        if self._in_stream_error:
+            self._clear_stream_error()
+            self.set_status(f"Reading from {self._sample_path}")
+        # Skip the repaint entirely when the displayed value did not change
+        if txt != self._last_txt:
+            self.readout_lbl.setText(txt)
+            self._last_txt = txt
+
+    @pyqtSlot()
+    def check_stream(self):
+        # Only runs while streaming: stop_live stops the timer before clearing state
+        stalled = time.monotonic() - self._last_sample_t
+        if stalled > self._stall_s:
+            self.stream_error(f"No samples from {self.device_id} for {stalled:.0f} s")
+
+    # No polling while the window is hidden or minimized
+    def hideEvent(self, event):
+        if self.worker is not None:
+            self.worker._paused = True
+        self.timer.stop()
+        super().hideEvent(event)
 
-        self.x_lbl.setText(f"X: {x:+.6e}")
-        self.y_lbl.setText(f"Y: {y:+.6e}")
-        self.r_lbl.setText(f"Amplitude (R): {r:.6e}")
-        self.phi_lbl.setText(f"Phase (phi): {phi:+.3f} rad")
+    def showEvent(self, event):
+        if self.streaming and self.worker is not None:
+            self.worker._paused = False
+            self._last_sample_t = time.monotonic()
+            self.timer.start()
+        super().showEvent(event)
 
     def closeEvent(self, event):
         # Ensure we release resources
         try:
             if self.streaming:
                 self.stop_live()
+            self.release_device()
+            # Drop the cached sessions so their data server connections are released
+            close_all_sessions()
+            self.session = None
+            self._endpoint = None
         finally:
             event.accept()
 
@@ -0,0 +1,65 @@
+"""
+Shared LabOne Data Server helpers for the MFLI monitor.
+
+Keeps one Session per host/port and briefly caches the visible-device list,
+so repeated Connect / Refresh clicks don't pay a new handshake or a new
+/zi/devices/visible query every time.
+"""
+
+import time
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Tuple
+
+if TYPE_CHECKING:
+    from zhinst.toolkit import Session
+
+
+_sessions: Dict[Tuple[str, int], "Session"] = {}
+
+
+def get_session(host: str, port: int) -> "Session":
+    """One Session per data server endpoint; reconnecting to it skips the handshake."""
+    session = _sessions.get((host, port))
+    if session is None:
+        # Imported on first Connect: zhinst.toolkit pulls in a large native library,
+        # and the window should not wait for it before it can be shown
+        from zhinst.toolkit import Session
+        session = _sessions[(host, port)] = Session(host, port)
+    return session
+
+
+def close_session(host: str, port: int):
+    """Forget the cached Session for this endpoint and disconnect it (best effort)."""
+    session = _sessions.pop((host, port), None)
+    if session is None:
+        return
+    _visible.pop(session, None)
+    try:
+        session.daq_server.disconnect()
+    except Exception:
+        pass
+
+
+def close_all_sessions():
+    for host, port in list(_sessions):
+        close_session(host, port)
+
+
+@dataclass
+class _VisibleCache:
+    timestamp: float
+    devices: Tuple[str, ...]
+
+
+_visible = weakref.WeakKeyDictionary()
+
+
+def list_visible(session: "Session", ttl: float = 2.0) -> Tuple[str, ...]:
+    """Visible devices for this session, re-queried only when older than ttl seconds."""
+    now = time.monotonic()
+    cached = _visible.get(session)
+    if cached is None or now - cached.timestamp > ttl:
+        cached = _VisibleCache(now, tuple(session.devices.visible()))
+        _visible[session] = cached
+    return cached.devices